@@ -1,8 +1,10 @@
 """Configuration management for claude-stt."""
 
+import functools
 import logging
 import os
 import platform
+import shutil
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -53,6 +55,9 @@ class Config:
     # Only the final trailing newline (if any) becomes a real Enter
     soft_newlines: bool = True
 
+    # Delay before injecting via ydotool so hotkey modifiers are released
+    injection_delay_ms: int = 200
+
     # Language for transcription ("auto" = detect, or ISO 639-1 code e.g. "en")
     language: str = "auto"
 
@@ -111,6 +116,9 @@ class Config:
                 sound_effects=stt_config.get("sound_effects", cls.sound_effects),
                 improve_text=stt_config.get("improve_text", cls.improve_text),
                 soft_newlines=stt_config.get("soft_newlines", cls.soft_newlines),
+                injection_delay_ms=stt_config.get(
+                    "injection_delay_ms", cls.injection_delay_ms
+                ),
                 language=stt_config.get("language", cls.language),
             )
             config = config.validate()
@@ -149,6 +157,7 @@ class Config:
                 "sound_effects": self.sound_effects,
                 "improve_text": self.improve_text,
                 "soft_newlines": self.soft_newlines,
+                "injection_delay_ms": self.injection_delay_ms,
                 "language": self.language,
             }
         }
@@ -220,6 +229,23 @@ class Config:
             logger.warning("max_recording_seconds too high; clamping to 600")
             self.max_recording_seconds = 600
 
+        try:
+            self.injection_delay_ms = int(self.injection_delay_ms)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Invalid injection_delay_ms '%s'; defaulting to %s",
+                self.injection_delay_ms,
+                Config.injection_delay_ms,
+            )
+            self.injection_delay_ms = Config.injection_delay_ms
+
+        if self.injection_delay_ms < 0:
+            logger.warning("injection_delay_ms negative; clamping to 0")
+            self.injection_delay_ms = 0
+        elif self.injection_delay_ms > 2000:
+            logger.warning("injection_delay_ms too high; clamping to 2000")
+            self.injection_delay_ms = 2000
+
         if self.sample_rate != 16000:
             logger.warning("sample_rate %s not supported; forcing 16000", self.sample_rate)
             self.sample_rate = 16000
@@ -241,3 +267,12 @@ def is_wayland() -> bool:
     if get_platform() != "linux":
         return False
     return os.environ.get("XDG_SESSION_TYPE") == "wayland"
+
+
+@functools.lru_cache(maxsize=None)
+def which_cached(name: str) -> str | None:
+    """Locate an executable on PATH, memoizing the result per name.
+
+    Call ``which_cached.cache_clear()`` to pick up newly installed tools.
+    """
+    return shutil.which(name)
@@ -15,10 +15,10 @@ from .config import Config
 from .engines.whisper import WhisperEngine
 from .errors import EngineError, HotkeyError, RecorderError
 from .hotkey import HotkeyListener
-from .keyboard import output_text
+from .keyboard import output_text, prepare_output
 from .recorder import AudioRecorder, RecorderConfig
 from .sounds import SoundEvent, play_sound
-from .text_improver import improve_text
+from .text_improver import improve_text, start_session, stop_session
 from .window import get_active_window, WindowInfo
 
 
@@ -247,6 +247,10 @@ class STTDaemon:
             self._logger.error("Failed to load STT model")
             raise SystemExit(1)
 
+        if self.config.improve_text:
+            start_session()
+        prepare_output(self.config)
+
         self._logger.info("Model loaded. Ready for voice input.")
         if self.config.sound_effects:
             play_sound(SoundEvent.READY)
@@ -307,6 +311,8 @@ class STTDaemon:
         if self._hotkey:
             self._hotkey.stop()
 
+        stop_session()
+
         if self.config.sound_effects:
             play_sound(SoundEvent.SHUTDOWN)
         self._logger.info("claude-stt daemon stopped.")
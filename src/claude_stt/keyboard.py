@@ -1,7 +1,8 @@
 """Keyboard output: direct injection or clipboard fallback."""
 
+import atexit
+import functools
 import logging
-import shutil
 import subprocess
 import time
 from typing import Optional
@@ -16,17 +17,22 @@ except Exception as exc:
     _PYNPUT_AVAILABLE = False
     _PYNPUT_IMPORT_ERROR = exc
 
-from .config import Config, is_wayland
+from .config import Config, get_platform, is_wayland, which_cached
 from .sounds import SoundEvent, play_sound
+from .uinput_keyboard import UInputKeyboard, create_uinput_keyboard
 from .window import WindowInfo, restore_focus
 
 # Global keyboard controller
 _keyboard: Optional[Controller] = None
+_uinput_keyboard: Optional[UInputKeyboard] = None
+_uinput_checked = False
 _injection_capable: Optional[bool] = None
 _injection_checked_at: Optional[float] = None
 _injection_cache_ttl = 300.0
 _logger = logging.getLogger(__name__)
 _pynput_warned = False
+# The session type cannot change within a process lifetime
+_IS_WAYLAND = is_wayland()
 
 
 def get_keyboard() -> Controller:
@@ -39,6 +45,31 @@ def get_keyboard() -> Controller:
     return _keyboard
 
 
+def _get_uinput_keyboard() -> Optional[UInputKeyboard]:
+    """Get the persistent uinput keyboard on Linux, if enabled and usable."""
+    global _uinput_keyboard, _uinput_checked
+    if not _uinput_checked:
+        _uinput_checked = True
+        if get_platform() == "linux":
+            _uinput_keyboard = create_uinput_keyboard()
+            if _uinput_keyboard is not None:
+                atexit.register(_uinput_keyboard.close)
+    return _uinput_keyboard
+
+
+def prepare_output(config: Config) -> None:
+    """Set up output devices ahead of the first dictation.
+
+    Creating the uinput keyboard waits for the display server to register
+    the device, which would otherwise delay the first injected text.
+
+    Args:
+        config: Configuration; nothing is prepared for clipboard-only output.
+    """
+    if config.output_mode != "clipboard" and not _IS_WAYLAND:
+        _get_uinput_keyboard()
+
+
 def _warn_pynput_missing() -> None:
     global _pynput_warned
     if _pynput_warned:
@@ -52,7 +83,7 @@ def _warn_pynput_missing() -> None:
 
 def _has_ydotool() -> bool:
     """Check if ydotool is available for uinput-based text input."""
-    return shutil.which("ydotool") is not None
+    return which_cached("ydotool") is not None
 
 
 def _ydotool_type(text: str) -> bool:
@@ -63,7 +94,8 @@ def _ydotool_type(text: str) -> bool:
     """
     result = subprocess.run(
         ["ydotool", "type", "--", text],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         timeout=10,
     )
@@ -73,23 +105,24 @@ def _ydotool_type(text: str) -> bool:
     return True
 
 
-def _ydotool_key(key: str) -> bool:
-    """Send a key combination using ydotool.
+def _ydotool_key(*keys: str) -> bool:
+    """Send one or more key combinations in a single ydotool call.
 
     Args:
-        key: Key combo string (e.g. "shift+Return").
+        keys: Key combo strings (e.g. "shift+Return"), sent in order.
 
     Returns:
         True if successful, False otherwise.
     """
     result = subprocess.run(
-        ["ydotool", "key", key],
-        capture_output=True,
+        ["ydotool", "key", *keys],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         timeout=10,
     )
     if result.returncode != 0:
-        _logger.warning("ydotool key %s failed: %s", key, result.stderr)
+        _logger.warning("ydotool key %s failed: %s", " ".join(keys), result.stderr)
         return False
     return True
 
@@ -106,7 +139,8 @@ def _output_via_ydotool(text: str, config: Config) -> bool:
     """
     _logger.debug("Injecting text via ydotool (%d chars)", len(text))
     # Brief delay to let modifier keys from the hotkey fully release
-    time.sleep(0.2)
+    if config.injection_delay_ms > 0:
+        time.sleep(config.injection_delay_ms / 1000)
 
     try:
         if config.soft_newlines and "\n" in text:
@@ -125,6 +159,22 @@ def _output_via_ydotool(text: str, config: Config) -> bool:
         return False
 
 
+def _split_soft_lines(text: str) -> tuple[list[str], bool]:
+    """Split text into lines for soft-newline typing.
+
+    Returns:
+        Tuple of (lines, has_trailing). A trailing newline does not produce
+        an empty final line; has_trailing records it instead.
+    """
+    has_trailing = text.endswith("\n")
+    # Only \n (and \r\n) are line breaks; splitlines() would also split on
+    # \r, \x0b, \x0c, \x1c-\x1e, \x85 and \u2028/\u2029.
+    lines = text.replace("\r\n", "\n").split("\n")
+    if has_trailing:
+        lines.pop()
+    return lines, has_trailing
+
+
 def _ydotool_type_soft_newlines(text: str) -> bool:
     """Type text using ydotool with Shift+Enter for intermediate newlines.
 
@@ -134,24 +184,28 @@ def _ydotool_type_soft_newlines(text: str) -> bool:
     Returns:
         True if successful, False otherwise.
     """
-    has_trailing = text.endswith("\n")
-    lines = text.split("\n")
-    if has_trailing and lines[-1] == "":
-        lines = lines[:-1]
+    lines, has_trailing = _split_soft_lines(text)
 
+    # Consecutive keys (blank lines, trailing Enter) are batched into one
+    # ydotool call to avoid a process spawn per keystroke.
+    pending_keys: list[str] = []
     for i, line in enumerate(lines):
         if line:
+            if pending_keys:
+                if not _ydotool_key(*pending_keys):
+                    return False
+                pending_keys = []
             if not _ydotool_type(line):
                 return False
 
         is_last = i == len(lines) - 1
         if not is_last:
-            if not _ydotool_key("shift+Return"):
-                return False
+            pending_keys.append("shift+Return")
         elif has_trailing:
-            if not _ydotool_key("Return"):
-                return False
+            pending_keys.append("Return")
 
+    if pending_keys:
+        return _ydotool_key(*pending_keys)
     return True
 
 
@@ -175,6 +229,10 @@ def test_injection() -> bool:
     ):
         return _injection_capable
 
+    # Re-probe PATH and clipboard too, so tools installed since the last check are found
+    which_cached.cache_clear()
+    _clipboard_ready.cache_clear()
+
     def cache_result(capable: bool) -> bool:
         global _injection_capable, _injection_checked_at
         _injection_capable = capable
@@ -182,7 +240,7 @@ def test_injection() -> bool:
         return capable
 
     # On Wayland, require ydotool
-    if is_wayland():
+    if _IS_WAYLAND:
         return cache_result(_has_ydotool())
 
     if not _PYNPUT_AVAILABLE:
@@ -235,11 +293,7 @@ def _type_with_soft_newlines(kb: Controller, text: str) -> None:
         kb: Keyboard controller.
         text: Text to type, may contain newlines.
     """
-    has_trailing = text.endswith("\n")
-    lines = text.split("\n")
-    # Remove empty trailing element if text ended with newline
-    if has_trailing and lines[-1] == "":
-        lines = lines[:-1]
+    lines, has_trailing = _split_soft_lines(text)
 
     for i, line in enumerate(lines):
         if line:
@@ -248,14 +302,11 @@ def _type_with_soft_newlines(kb: Controller, text: str) -> None:
         is_last = i == len(lines) - 1
         if not is_last:
             # Soft newline: Shift+Enter
-            kb.press(Key.shift)
-            kb.press(Key.enter)
-            kb.release(Key.enter)
-            kb.release(Key.shift)
+            with kb.pressed(Key.shift):
+                kb.tap(Key.enter)
         elif has_trailing:
             # Final trailing newline: real Enter
-            kb.press(Key.enter)
-            kb.release(Key.enter)
+            kb.tap(Key.enter)
 
 
 def _output_via_injection(
@@ -274,7 +325,7 @@ def _output_via_injection(
         True if successful, False otherwise.
     """
     # On Wayland, use ydotool
-    if is_wayland():
+    if _IS_WAYLAND:
         if _has_ydotool():
             return _output_via_ydotool(text, config)
         _logger.warning("ydotool not available; falling back to clipboard")
@@ -292,6 +343,10 @@ def _output_via_injection(
 
     try:
         kb = get_keyboard()
+        # Prefer direct uinput events when every character has a key mapping
+        uinput_kb = _get_uinput_keyboard()
+        if uinput_kb is not None and uinput_kb.can_type(text):
+            kb = uinput_kb
         if config.soft_newlines and "\n" in text:
             _type_with_soft_newlines(kb, text)
         else:
@@ -306,6 +361,23 @@ def _output_via_injection(
         return _output_via_clipboard(text, config)
 
 
+@functools.lru_cache(maxsize=1)
+def _clipboard_ready() -> bool:
+    """Check whether pyperclip has a usable clipboard backend.
+
+    The probe can shell out to xclip/xsel, so the result is cached.
+    """
+    try:
+        import pyperclip
+    except ImportError:
+        _logger.error("pyperclip not installed; clipboard output unavailable")
+        return False
+    if hasattr(pyperclip, "is_available") and not pyperclip.is_available():
+        _logger.error("No clipboard mechanism available")
+        return False
+    return True
+
+
 def _output_via_clipboard(text: str, config: Config) -> bool:
     """Output text by copying to clipboard.
 
@@ -316,15 +388,11 @@ def _output_via_clipboard(text: str, config: Config) -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    if not _clipboard_ready():
+        return False
+
     try:
-        try:
-            import pyperclip
-        except ImportError:
-            _logger.error("pyperclip not installed; clipboard output unavailable")
-            return False
-        if hasattr(pyperclip, "is_available") and not pyperclip.is_available():
-            _logger.error("No clipboard mechanism available")
-            return False
+        import pyperclip
 
         pyperclip.copy(text)
 
@@ -4,15 +4,35 @@ Bundled sounds are from Kenney Interface Sounds (CC0 public domain).
 See assets/SOUNDS_LICENSE.txt for details.
 """
 
+import concurrent.futures
+import functools
 import logging
+import os
 import platform
-import shutil
+import signal
 import subprocess
 from enum import Enum
 from pathlib import Path
+from typing import Callable, Optional
+
+from .config import which_cached
 
 _logger = logging.getLogger(__name__)
 _ASSETS_DIR = Path(__file__).parent / "assets"
+_SYSTEM = platform.system()
+
+# Playback runs off the caller's thread so output isn't delayed by spawning
+# players. One worker keeps events ordered; pending sounds are drained at
+# interpreter exit by concurrent.futures.
+_sound_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="claude-stt-sound",
+)
+
+# Children started via posix_spawn. They are reaped on the next spawn rather
+# than from a SIGCHLD handler, which would also collect children that
+# subprocess waits on; at most one zombie per recent sound lingers meanwhile.
+_spawned_pids: list[int] = []
 
 
 class SoundEvent(Enum):
@@ -25,7 +45,7 @@ class SoundEvent(Enum):
     SHUTDOWN = "shutdown"
 
 
-SOUNDS: dict[SoundEvent, Path] = {
+_SOUND_FILES: dict[SoundEvent, Path] = {
     SoundEvent.START: _ASSETS_DIR / "start.ogg",
     SoundEvent.STOP: _ASSETS_DIR / "stop.ogg",
     SoundEvent.COMPLETE: _ASSETS_DIR / "complete.ogg",
@@ -35,6 +55,11 @@ SOUNDS: dict[SoundEvent, Path] = {
     SoundEvent.SHUTDOWN: _ASSETS_DIR / "shutdown.ogg",
 }
 
+# Bundled assets don't change at runtime, so resolve existence once
+SOUNDS: dict[SoundEvent, str] = {
+    event: str(path) for event, path in _SOUND_FILES.items() if path.exists()
+}
+
 # Linux desktop notification messages (requires notify-send / libnotify-bin)
 LINUX_NOTIFICATIONS: dict[SoundEvent, tuple[str, str]] = {
     SoundEvent.START: ("Claude STT", "Recording..."),
@@ -50,74 +75,102 @@ LINUX_NOTIFICATIONS: dict[SoundEvent, tuple[str, str]] = {
 def play_sound(event: SoundEvent) -> None:
     """Play a bundled sound for the given event.
 
+    Returns immediately; playback happens on a background thread.
+
     Args:
         event: The type of sound event to play.
     """
     try:
-        system = platform.system()
-
-        if system == "Windows":
-            _play_windows_sound(event)
-            return
-
-        sound_file = SOUNDS.get(event)
-        if not sound_file or not sound_file.exists():
-            _logger.debug("Sound file missing for event: %s", event.value)
-            return
+        _sound_executor.submit(_play_now, event)
+    except RuntimeError:
+        # Executor already shut down during interpreter exit
+        _logger.debug("Sound skipped during shutdown: %s", event.value)
 
-        _play_sound_file(str(sound_file), system)
 
-        if system == "Linux":
-            _send_linux_notification(event)
+def _play_now(event: SoundEvent) -> None:
+    try:
+        _PLAY_BACKEND(event)
+        # As before, no notification is sent when the sound asset is missing
+        if _NOTIFY_BACKEND is not None and event in SOUNDS:
+            _NOTIFY_BACKEND(event)
     except Exception:
         _logger.debug("Sound playback failed for event: %s", event.value, exc_info=True)
 
 
-def _play_sound_file(sound_file: str, system: str) -> None:
-    """Play a sound file using the best available player.
+def _spawn_quiet(path: str, args: list[str]) -> None:
+    """Start a fire-and-forget helper with stdout/stderr discarded.
+
+    Uses os.posix_spawn where available, which skips most of the Python-level
+    setup subprocess.Popen does for every call.
 
     Args:
-        sound_file: Path to the sound file.
-        system: Platform name from platform.system().
+        path: Resolved executable path.
+        args: Full argument vector, including argv[0].
     """
-    if system == "Darwin":
-        if shutil.which("afplay"):
-            subprocess.Popen(
-                ["afplay", sound_file],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        return
-
-    # Linux: try paplay (PulseAudio/PipeWire), then aplay (ALSA)
-    if shutil.which("paplay"):
+    if not hasattr(os, "posix_spawn"):
         subprocess.Popen(
-            ["paplay", sound_file],
+            args,
+            executable=path,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-    elif shutil.which("aplay"):
-        subprocess.Popen(
-            ["aplay", "-q", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+        return
+
+    _reap_spawned()
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    # Python ignores SIGPIPE; restore the default so the helper can die on
+    # a closed pipe like it would when started from a shell.
+    _spawned_pids.append(
+        os.posix_spawn(
+            path,
+            args,
+            os.environ,
+            file_actions=file_actions,
+            setsigdef=(signal.SIGPIPE,),
         )
+    )
 
 
-def _send_linux_notification(event: SoundEvent) -> None:
-    """Send a desktop notification on Linux via notify-send."""
-    if not shutil.which("notify-send"):
+def _reap_spawned() -> None:
+    """Collect exit status of finished helpers so they don't linger as zombies."""
+    for pid in list(_spawned_pids):
+        try:
+            done, _status = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _spawned_pids.remove(pid)
+
+
+def _play_sound_file(path: str, args: list[str], event: SoundEvent) -> None:
+    """Play the bundled sound for an event with an external player.
+
+    Args:
+        path: Resolved player executable path.
+        args: Player argument vector; the sound file is appended.
+        event: The type of sound event to play.
+    """
+    sound_file = SOUNDS.get(event)
+    if not sound_file:
+        _logger.debug("Sound file missing for event: %s", event.value)
         return
+    _spawn_quiet(path, [*args, sound_file])
+
+
+def _send_linux_notification(path: str, event: SoundEvent) -> None:
+    """Send a desktop notification on Linux via notify-send."""
     notification = LINUX_NOTIFICATIONS.get(event)
     if not notification:
         return
     title, body = notification
     urgency = "critical" if event in (SoundEvent.ERROR, SoundEvent.WARNING) else "low"
-    subprocess.Popen(
+    _spawn_quiet(
+        path,
         ["notify-send", "--urgency", urgency, "--expire-time", "2000",
          "--app-name", "claude-stt", title, body],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
     )
 
 
@@ -138,3 +191,41 @@ def _play_windows_sound(event: SoundEvent) -> None:
         winsound.MessageBeep(sound_type)
     except ImportError:
         _logger.debug("winsound not available")
+
+
+def _no_sound(event: SoundEvent) -> None:
+    _logger.debug("No sound player available for event: %s", event.value)
+
+
+def _select_play_backend() -> Callable[[SoundEvent], None]:
+    """Pick the sound player for this platform."""
+    if _SYSTEM == "Windows":
+        return _play_windows_sound
+
+    if _SYSTEM == "Darwin":
+        players = [["afplay"]]
+    else:
+        # Linux: try paplay (PulseAudio/PipeWire), then aplay (ALSA)
+        players = [["paplay"], ["aplay", "-q"]]
+    for args in players:
+        path = which_cached(args[0])
+        if path:
+            return functools.partial(_play_sound_file, path, args)
+    return _no_sound
+
+
+def _select_notify_backend() -> Optional[Callable[[SoundEvent], None]]:
+    """Pick the desktop notifier, if any (Linux only)."""
+    if _SYSTEM != "Linux":
+        return None
+    path = which_cached("notify-send")
+    if not path:
+        return None
+    return functools.partial(_send_linux_notification, path)
+
+
+# Platform and installed tools don't change while the daemon runs, so the
+# backends are chosen once at import; which_cached.cache_clear() does not
+# re-select them.
+_PLAY_BACKEND = _select_play_backend()
+_NOTIFY_BACKEND = _select_notify_backend()
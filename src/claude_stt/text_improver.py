@@ -1,8 +1,19 @@
 """Text improvement using Claude CLI."""
 
+import atexit
 import difflib
+import functools
+import json
 import logging
+import re
 import subprocess
+import threading
+from typing import Optional
+
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
 
 _logger = logging.getLogger(__name__)
 
@@ -11,6 +22,15 @@ _RED = "\033[91m"
 _GREEN = "\033[92m"
 _RESET = "\033[0m"
 _STRIKETHROUGH = "\033[9m"
+_DEL_PREFIX = _RED + _STRIKETHROUGH
+_INS_PREFIX = _GREEN
+
+
+def _word_opcodes(orig_words: list[str], impr_words: list[str]):
+    """Edit opcodes between two word lists, via rapidfuzz's C diff when installed."""
+    if _Levenshtein is not None:
+        return _Levenshtein.opcodes(orig_words, impr_words)
+    return difflib.SequenceMatcher(None, orig_words, impr_words).get_opcodes()
 
 
 def _colored_diff(original: str, improved: str) -> str:
@@ -21,22 +41,37 @@ def _colored_diff(original: str, improved: str) -> str:
     orig_words = original.split()
     impr_words = improved.split()
 
-    matcher = difflib.SequenceMatcher(None, orig_words, impr_words)
-    result = []
+    # Edits are usually local (punctuation, a word or two), so only diff the
+    # span between the common leading and trailing words.
+    limit = min(len(orig_words), len(impr_words))
+    prefix = 0
+    while prefix < limit and orig_words[prefix] == impr_words[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and orig_words[-1 - suffix] == impr_words[-1 - suffix]
+    ):
+        suffix += 1
+
+    orig_mid = orig_words[prefix:len(orig_words) - suffix]
+    impr_mid = impr_words[prefix:len(impr_words) - suffix]
+
+    parts: list[str] = orig_words[:prefix]
+    extend = parts.extend
 
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+    for op, i1, i2, j1, j2 in _word_opcodes(orig_mid, impr_mid):
         if op == "equal":
-            result.extend(orig_words[i1:i2])
+            extend(orig_mid[i1:i2])
         else:
             # "replace" emits both removed and inserted; "delete"/"insert" emit one side
-            if op in ("replace", "delete"):
-                result.extend(
-                    f"{_RED}{_STRIKETHROUGH}{w}{_RESET}" for w in orig_words[i1:i2]
-                )
-            if op in ("replace", "insert"):
-                result.extend(f"{_GREEN}{w}{_RESET}" for w in impr_words[j1:j2])
+            if op != "insert":
+                extend([_DEL_PREFIX + w + _RESET for w in orig_mid[i1:i2]])
+            if op != "delete":
+                extend([_INS_PREFIX + w + _RESET for w in impr_mid[j1:j2]])
 
-    return " ".join(result)
+    extend(orig_words[len(orig_words) - suffix:])
+    return " ".join(parts)
 
 
 _IMPROVE_PROMPT = (
@@ -45,6 +80,216 @@ _IMPROVE_PROMPT = (
 )
 
 
+# Acknowledgements ("Yes.", "Thanks!", "Sounds good.") that are already
+# capitalized and punctuated skip the Claude round trip. This is an explicit
+# list: Whisper capitalizes and punctuates almost every sentence, so a
+# shape-based check would also skip dictations that need grammar fixes.
+_ACKNOWLEDGEMENTS = frozenset({
+    "yes", "yeah", "yep", "no", "nope", "ok", "okay", "sure", "thanks",
+    "thank you", "got it", "sounds good", "perfect", "great", "done",
+    "correct", "exactly", "agreed",
+})
+_TRIVIAL_RE = re.compile(r"^[A-Z][A-Za-z' ]*[.!?]$")
+
+
+def _is_trivial(text: str) -> bool:
+    return (
+        _TRIVIAL_RE.match(text) is not None
+        and text[:-1].lower() in _ACKNOWLEDGEMENTS
+    )
+
+
+class _NoResult(Exception):
+    """The spare process exited without producing a result event."""
+
+
+class _ClaudeSpare:
+    """Pre-spawned ``claude`` process that answers exactly one prompt.
+
+    Every prompt goes to a fresh process, so dictations never share
+    conversation context. The replacement is spawned as soon as a prompt is
+    answered, so its CLI start-up overlaps with the wait for the next one.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._closed = False
+        # Guards _proc and _closed only; never held while waiting on claude
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Spawn the spare process ahead of the first prompt."""
+        with self._lock:
+            self._closed = False
+            if self._proc is None:
+                self._proc = self._spawn()
+
+    def close(self) -> None:
+        """Terminate the idle spare and stop spawning replacements.
+
+        A prompt already in flight finishes on its own process.
+        """
+        with self._lock:
+            self._closed = True
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            _stop_process(proc)
+
+    def ask(self, prompt: str, timeout: float) -> Optional[str]:
+        """Send a prompt to the spare process and wait for its result.
+
+        Returns:
+            The model's reply, or None if Claude reported an error.
+
+        Raises:
+            _NoResult: If the process exited without a result event.
+            subprocess.TimeoutExpired: If no result arrived within timeout.
+        """
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            # Spare never started, was closed, or died while idle; use a fresh one
+            if proc is not None:
+                _stop_process(proc)
+            proc = self._spawn()
+        try:
+            return self._exchange(proc, prompt, timeout)
+        finally:
+            _stop_process(proc)
+            self._replenish()
+
+    def _replenish(self) -> None:
+        """Spawn the next spare unless closed or another caller already did."""
+        if self._closed:
+            return
+        try:
+            spare = self._spawn()
+        except Exception:
+            _logger.debug("Failed to spawn spare claude process", exc_info=True)
+            return
+        with self._lock:
+            if not self._closed and self._proc is None:
+                self._proc, spare = spare, None
+        if spare is not None:
+            _stop_process(spare)
+
+    @staticmethod
+    def _exchange(proc: subprocess.Popen, prompt: str, timeout: float) -> Optional[str]:
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        try:
+            # Closing stdin after the single message lets the CLI exit once it answers
+            stdout, stderr = proc.communicate(json.dumps(message) + "\n", timeout=timeout)
+        except subprocess.TimeoutExpired:
+            raise subprocess.TimeoutExpired("claude", timeout) from None
+        except OSError as exc:
+            raise _NoResult from exc
+
+        for line in stdout.splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict) or event.get("type") != "result":
+                continue
+            if event.get("is_error"):
+                _logger.warning("claude CLI failed: %s", event.get("result"))
+                return None
+            return event.get("result")
+
+        _logger.debug("claude exited (%s) without a result: %s", proc.returncode, stderr)
+        raise _NoResult
+
+    @staticmethod
+    def _spawn() -> subprocess.Popen:
+        return subprocess.Popen(
+            [
+                "claude",
+                "--model", "haiku",
+                "--print",
+                "--verbose",
+                "--input-format", "stream-json",
+                "--output-format", "stream-json",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    """Terminate a claude process if still running and reap it."""
+    if proc.poll() is None:
+        proc.kill()
+    try:
+        proc.communicate(timeout=1.0)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+
+
+_spare = _ClaudeSpare()
+atexit.register(_spare.close)
+
+
+def start_session() -> None:
+    """Pre-spawn a Claude CLI process so the first dictation is fast."""
+    try:
+        _spare.start()
+    except FileNotFoundError:
+        _logger.warning("claude CLI not found")
+    except Exception:
+        _logger.warning("Failed to start claude process", exc_info=True)
+
+
+def stop_session() -> None:
+    """Stop the pre-spawned Claude CLI process."""
+    _spare.close()
+
+
+def _run_claude(prompt: str, timeout: float) -> Optional[str]:
+    """Get a reply from the spare process, else a one-shot CLI call."""
+    try:
+        return _spare.ask(prompt, timeout)
+    except _NoResult:
+        _logger.debug("spare claude process gave no result; using one-shot CLI")
+
+    result = subprocess.run(
+        [
+            "claude",
+            "--model", "haiku",
+            "--print",
+            "-p", prompt,
+        ],
+        capture_output=True,
+        timeout=timeout,
+        text=True,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        _logger.warning("claude CLI failed: %s", result.stderr)
+        return None
+    return result.stdout
+
+
+class _NoReply(Exception):
+    """Claude produced no usable reply; raised so lru_cache skips the result."""
+
+
+# Transcripts longer than this bypass the result cache to bound its memory
+_CACHE_MAX_CHARS = 2048
+
+
+def _improve(text: str, timeout: float) -> str:
+    reply = _run_claude(f"{_IMPROVE_PROMPT}\n\nText: {text}", timeout)
+    if not reply or not reply.strip():
+        raise _NoReply
+    return reply.strip()
+
+
+# Dictated commands ("run tests", "commit") repeat often; only successful
+# replies are cached since failures raise.
+_improve_cached = functools.lru_cache(maxsize=128)(_improve)
+
+
 def improve_text(text: str, timeout: float = 30.0) -> str:
     """Improve transcribed text using Claude CLI.
 
@@ -55,29 +300,22 @@ def improve_text(text: str, timeout: float = 30.0) -> str:
     Returns:
         Improved text, or original if improvement fails.
     """
-    if not text.strip():
+    stripped = text.strip()
+    if not stripped or _is_trivial(stripped):
         return text
 
     try:
-        result = subprocess.run(
-            [
-                "claude",
-                "--model", "haiku",
-                "--print",
-                "-p", f"{_IMPROVE_PROMPT}\n\nText: {text}",
-            ],
-            capture_output=True,
-            timeout=timeout,
-            text=True,
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            _logger.warning("claude CLI failed: %s", result.stderr)
-            return text
+        if len(stripped) > _CACHE_MAX_CHARS:
+            improved = _improve(stripped, timeout)
+        else:
+            improved = _improve_cached(stripped, timeout)
 
-        improved = result.stdout.strip()
-        if improved != text:
+        # Skip the word diff entirely when it would be discarded
+        if improved != text and _logger.isEnabledFor(logging.INFO):
             _logger.info("Text improved: %s", _colored_diff(text, improved))
         return improved
+    except _NoReply:
+        pass
     except subprocess.TimeoutExpired:
         _logger.warning("claude CLI timed out")
     except FileNotFoundError:
@@ -0,0 +1,148 @@
+"""Keyboard injection through a persistent /dev/uinput device (Linux).
+
+Writes key events straight to the kernel instead of going through pynput's
+per-character XTest round trips. Requires python-evdev and write access to
+/dev/uinput, and assumes a US keyboard layout, so it is opt-in via
+CLAUDE_STT_UINPUT=1.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import time
+from typing import Iterator, Optional
+
+try:
+    from evdev import UInput, ecodes
+    _EVDEV_AVAILABLE = True
+except ImportError:
+    UInput = None
+    ecodes = None
+    _EVDEV_AVAILABLE = False
+
+try:
+    from pynput.keyboard import Key
+except Exception:
+    Key = None
+
+_logger = logging.getLogger(__name__)
+
+# Give the display server time to pick up a newly created device; events
+# written before it is registered are dropped.
+_DEVICE_SETTLE_SECONDS = 0.2
+
+_SHIFTED_SYMBOLS = {
+    "!": "1", "@": "2", "#": "3", "$": "4", "%": "5",
+    "^": "6", "&": "7", "*": "8", "(": "9", ")": "0",
+    "_": "-", "+": "=", "{": "[", "}": "]", "|": "\\",
+    ":": ";", '"': "'", "~": "`", "<": ",", ">": ".", "?": "/",
+}
+
+_SYMBOL_KEYS = {
+    " ": "KEY_SPACE", "\n": "KEY_ENTER", "\t": "KEY_TAB",
+    "-": "KEY_MINUS", "=": "KEY_EQUAL", "[": "KEY_LEFTBRACE",
+    "]": "KEY_RIGHTBRACE", "\\": "KEY_BACKSLASH", ";": "KEY_SEMICOLON",
+    "'": "KEY_APOSTROPHE", "`": "KEY_GRAVE", ",": "KEY_COMMA",
+    ".": "KEY_DOT", "/": "KEY_SLASH",
+}
+
+
+def _build_char_table() -> dict[str, tuple[int, bool]]:
+    """Map printable ASCII characters to (keycode, needs_shift) on a US layout."""
+    table: dict[str, tuple[int, bool]] = {}
+    for char in "abcdefghijklmnopqrstuvwxyz":
+        code = ecodes.ecodes[f"KEY_{char.upper()}"]
+        table[char] = (code, False)
+        table[char.upper()] = (code, True)
+    for digit in "0123456789":
+        table[digit] = (ecodes.ecodes[f"KEY_{digit}"], False)
+    for char, name in _SYMBOL_KEYS.items():
+        table[char] = (ecodes.ecodes[name], False)
+    for char, base in _SHIFTED_SYMBOLS.items():
+        table[char] = (table[base][0], True)
+    return table
+
+
+class UInputKeyboard:
+    """Minimal pynput-compatible controller backed by a uinput device.
+
+    Supports the subset of the pynput Controller API used for output:
+    ``type``, ``press``, ``release``, ``tap`` and ``pressed``.
+    """
+
+    def __init__(self) -> None:
+        self._ui = UInput(name="claude-stt-keyboard")
+        self._chars = _build_char_table()
+        self._special = {
+            Key.shift: ecodes.KEY_LEFTSHIFT,
+            Key.enter: ecodes.KEY_ENTER,
+        }
+        time.sleep(_DEVICE_SETTLE_SECONDS)
+
+    def can_type(self, text: str) -> bool:
+        """Check whether every character has a key mapping."""
+        return all(char in self._chars for char in text)
+
+    def type(self, text: str) -> None:
+        """Type text; raises ValueError for characters with no key mapping."""
+        if not self.can_type(text):
+            raise ValueError("text contains characters without a uinput key mapping")
+        shift = ecodes.KEY_LEFTSHIFT
+        for char in text:
+            code, shifted = self._chars[char]
+            if shifted:
+                self._ui.write(ecodes.EV_KEY, shift, 1)
+            self._ui.write(ecodes.EV_KEY, code, 1)
+            self._ui.write(ecodes.EV_KEY, code, 0)
+            if shifted:
+                self._ui.write(ecodes.EV_KEY, shift, 0)
+            self._ui.syn()
+
+    def press(self, key) -> None:
+        self._ui.write(ecodes.EV_KEY, self._code(key), 1)
+        self._ui.syn()
+
+    def release(self, key) -> None:
+        self._ui.write(ecodes.EV_KEY, self._code(key), 0)
+        self._ui.syn()
+
+    def tap(self, key) -> None:
+        self.press(key)
+        self.release(key)
+
+    @contextlib.contextmanager
+    def pressed(self, *keys) -> Iterator[None]:
+        for key in keys:
+            self.press(key)
+        try:
+            yield
+        finally:
+            for key in reversed(keys):
+                self.release(key)
+
+    def close(self) -> None:
+        self._ui.close()
+
+    def _code(self, key) -> int:
+        if key in self._special:
+            return self._special[key]
+        return self._chars[key][0]
+
+
+def create_uinput_keyboard() -> Optional[UInputKeyboard]:
+    """Create the uinput keyboard if enabled and usable, else None."""
+    if os.environ.get("CLAUDE_STT_UINPUT") != "1":
+        return None
+    if not _EVDEV_AVAILABLE or Key is None:
+        _logger.warning("CLAUDE_STT_UINPUT set but python-evdev/pynput unavailable")
+        return None
+    if not os.access("/dev/uinput", os.W_OK):
+        _logger.warning("CLAUDE_STT_UINPUT set but /dev/uinput is not writable")
+        return None
+    try:
+        return UInputKeyboard()
+    except Exception:
+        _logger.warning("Failed to create uinput keyboard", exc_info=True)
+        return None
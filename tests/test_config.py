@@ -10,12 +10,14 @@ class ConfigTests(unittest.TestCase):
             output_mode="wat",
             max_recording_seconds=0,
             sample_rate=8000,
+            injection_delay_ms=-5,
         ).validate()
 
         self.assertEqual(config.mode, "toggle")
         self.assertEqual(config.output_mode, "auto")
         self.assertEqual(config.max_recording_seconds, 1)
         self.assertEqual(config.sample_rate, 16000)
+        self.assertEqual(config.injection_delay_ms, 0)
 
 
 if __name__ == "__main__":
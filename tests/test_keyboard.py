@@ -1,10 +1,23 @@
 import unittest
+from unittest import mock
 
-from claude_stt.config import Config
+from claude_stt.config import Config, which_cached
 from claude_stt import keyboard
 
 
 class KeyboardOutputTests(unittest.TestCase):
+    def setUp(self):
+        which_cached.cache_clear()
+
+    def tearDown(self):
+        which_cached.cache_clear()
+
+    def test_has_ydotool_caches_path_lookup(self):
+        with mock.patch("claude_stt.config.shutil.which", return_value=None) as which:
+            self.assertFalse(keyboard._has_ydotool())
+            self.assertFalse(keyboard._has_ydotool())
+        which.assert_called_once_with("ydotool")
+
     def test_output_falls_back_when_pynput_missing(self):
         original_available = keyboard._PYNPUT_AVAILABLE
         original_clipboard = keyboard._output_via_clipboard
@@ -35,6 +48,75 @@ class KeyboardOutputTests(unittest.TestCase):
             keyboard._injection_capable = original_capable
             keyboard._has_ydotool = original_has_ydotool
 
+    def test_ydotool_soft_newlines_batches_consecutive_keys(self):
+        calls = []
+        with mock.patch.object(
+            keyboard, "_ydotool_type", side_effect=lambda t: calls.append(("type", t)) or True
+        ), mock.patch.object(
+            keyboard, "_ydotool_key", side_effect=lambda *k: calls.append(("key", k)) or True
+        ):
+            self.assertTrue(keyboard._ydotool_type_soft_newlines("a\n\nb\n"))
+        self.assertEqual(
+            calls,
+            [
+                ("type", "a"),
+                ("key", ("shift+Return", "shift+Return")),
+                ("type", "b"),
+                ("key", ("Return",)),
+            ],
+        )
+
+    def test_ydotool_soft_newlines_splits_only_on_newline(self):
+        calls = []
+        with mock.patch.object(
+            keyboard, "_ydotool_type", side_effect=lambda t: calls.append(("type", t)) or True
+        ), mock.patch.object(
+            keyboard, "_ydotool_key", side_effect=lambda *k: calls.append(("key", k)) or True
+        ):
+            self.assertTrue(keyboard._ydotool_type_soft_newlines("a\r\nb\x0cc\n\x85"))
+        self.assertEqual(
+            calls,
+            [
+                ("type", "a"),
+                ("key", ("shift+Return",)),
+                ("type", "b\x0cc"),
+                ("key", ("shift+Return",)),
+                ("type", "\x85"),
+            ],
+        )
+
+    def _inject_with_uinput_stub(self, text):
+        pynput_kb = mock.Mock()
+        uinput_kb = mock.Mock()
+        uinput_kb.can_type.side_effect = str.isascii
+        config = Config(sound_effects=False, soft_newlines=False)
+        with mock.patch.object(keyboard, "_IS_WAYLAND", False), mock.patch.object(
+            keyboard, "_PYNPUT_AVAILABLE", True
+        ), mock.patch.object(keyboard, "get_keyboard", return_value=pynput_kb), mock.patch.object(
+            keyboard, "_get_uinput_keyboard", return_value=uinput_kb
+        ):
+            self.assertTrue(keyboard._output_via_injection(text, None, config))
+        return pynput_kb, uinput_kb
+
+    def test_injection_uses_uinput_for_mappable_text(self):
+        pynput_kb, uinput_kb = self._inject_with_uinput_stub("Hello, world!")
+        uinput_kb.type.assert_called_once_with("Hello, world!")
+        pynput_kb.type.assert_not_called()
+
+    def test_injection_falls_back_to_pynput_for_unmappable_text(self):
+        pynput_kb, uinput_kb = self._inject_with_uinput_stub("café")
+        pynput_kb.type.assert_called_once_with("café")
+        uinput_kb.type.assert_not_called()
+
+    def test_prepare_output_creates_uinput_keyboard_unless_clipboard_only(self):
+        with mock.patch.object(keyboard, "_IS_WAYLAND", False), mock.patch.object(
+            keyboard, "_get_uinput_keyboard"
+        ) as get_uinput:
+            keyboard.prepare_output(Config(output_mode="clipboard"))
+            get_uinput.assert_not_called()
+            keyboard.prepare_output(Config())
+            get_uinput.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
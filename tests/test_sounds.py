@@ -0,0 +1,87 @@
+import os
+import unittest
+from unittest import mock
+
+from claude_stt import sounds
+from claude_stt.sounds import SoundEvent
+
+
+def _which(*available):
+    return lambda name: f"/usr/bin/{name}" if name in available else None
+
+
+class BackendSelectionTests(unittest.TestCase):
+    def _select(self, system, *available):
+        with mock.patch.object(sounds, "_SYSTEM", system), mock.patch.object(
+            sounds, "which_cached", side_effect=_which(*available)
+        ):
+            return sounds._select_play_backend(), sounds._select_notify_backend()
+
+    def test_darwin_uses_afplay_without_notifications(self):
+        play, notify = self._select("Darwin", "afplay", "notify-send")
+        self.assertIs(play.func, sounds._play_sound_file)
+        self.assertEqual(play.args, ("/usr/bin/afplay", ["afplay"]))
+        self.assertIsNone(notify)
+
+    def test_linux_prefers_paplay(self):
+        play, notify = self._select("Linux", "paplay", "aplay", "notify-send")
+        self.assertEqual(play.args, ("/usr/bin/paplay", ["paplay"]))
+        self.assertIs(notify.func, sounds._send_linux_notification)
+        self.assertEqual(notify.args, ("/usr/bin/notify-send",))
+
+    def test_linux_falls_back_to_aplay(self):
+        play, notify = self._select("Linux", "aplay")
+        self.assertEqual(play.args, ("/usr/bin/aplay", ["aplay", "-q"]))
+        self.assertIsNone(notify)
+
+    def test_no_player_available(self):
+        play, notify = self._select("Linux")
+        self.assertIs(play, sounds._no_sound)
+        self.assertIsNone(notify)
+
+
+class PlayNowTests(unittest.TestCase):
+    def setUp(self):
+        self.play = mock.Mock()
+        self.notify = mock.Mock()
+        for name, value in (("_PLAY_BACKEND", self.play), ("_NOTIFY_BACKEND", self.notify)):
+            patcher = mock.patch.object(sounds, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_plays_and_notifies(self):
+        with mock.patch.dict(sounds.SOUNDS, {SoundEvent.START: "/tmp/start.ogg"}):
+            sounds._play_now(SoundEvent.START)
+        self.play.assert_called_once_with(SoundEvent.START)
+        self.notify.assert_called_once_with(SoundEvent.START)
+
+    def test_skips_notification_when_asset_missing(self):
+        with mock.patch.dict(sounds.SOUNDS, {}, clear=True):
+            sounds._play_now(SoundEvent.START)
+        self.play.assert_called_once_with(SoundEvent.START)
+        self.notify.assert_not_called()
+
+
+@unittest.skipUnless(hasattr(os, "posix_spawn"), "posix_spawn not available")
+class SpawnReapTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(sounds, "_spawned_pids", [])
+        self.pids = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_next_spawn_reaps_finished_helper(self):
+        sounds._spawn_quiet("/bin/true", ["true"])
+        (first,) = self.pids
+        # Wait for the exit without collecting it, leaving a zombie behind
+        os.waitid(os.P_PID, first, os.WEXITED | os.WNOWAIT)
+
+        sounds._spawn_quiet("/bin/true", ["true"])
+        self.assertNotIn(first, self.pids)
+        self.assertEqual(len(self.pids), 1)
+        with self.assertRaises(ChildProcessError):
+            os.waitpid(first, 0)
+        os.waitpid(self.pids[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
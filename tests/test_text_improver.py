@@ -0,0 +1,256 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from claude_stt import text_improver
+
+# Stand-in for the claude CLI. In stream-json mode it answers each user
+# message with the text uppercased plus how many messages this process has
+# seen; trigger words make it hang, crash, or report an error.
+_FAKE_CLAUDE = textwrap.dedent(
+    """\
+    import json
+    import sys
+    import time
+
+    if "--input-format" not in sys.argv:
+        print("ONESHOT " + sys.argv[-1].split("Text: ")[-1])
+        sys.exit(0)
+
+    seen = 0
+    for line in sys.stdin:
+        seen += 1
+        text = json.loads(line)["message"]["content"].split("Text: ")[-1]
+        if "hang" in text:
+            time.sleep(30)
+        if "crash" in text:
+            sys.exit(1)
+        print(json.dumps({"type": "system"}), flush=True)
+        if "error" in text:
+            result = {"type": "result", "is_error": True, "result": "API error"}
+        else:
+            result = {"type": "result", "is_error": False, "result": f"{text.upper()} ({seen})"}
+        print(json.dumps(result), flush=True)
+    """
+)
+
+
+class ImproveTextTests(unittest.TestCase):
+    def setUp(self):
+        text_improver._improve_cached.cache_clear()
+
+    def test_uses_spare_process_reply(self):
+        with mock.patch.object(
+            text_improver._spare, "ask", return_value="Hello there."
+        ), mock.patch.object(text_improver.subprocess, "run") as run:
+            self.assertEqual(text_improver.improve_text("hello there"), "Hello there.")
+        run.assert_not_called()
+
+    def test_returns_original_on_timeout(self):
+        with mock.patch.object(
+            text_improver._spare,
+            "ask",
+            side_effect=subprocess.TimeoutExpired("claude", 1.0),
+        ):
+            self.assertEqual(text_improver.improve_text("hello there"), "hello there")
+
+    def test_skips_trivial_utterances(self):
+        with mock.patch.object(text_improver, "_run_claude") as run_claude:
+            for text in ("Yes.", "Thanks!", "Sounds good.", "OK."):
+                self.assertEqual(text_improver.improve_text(text), text)
+        run_claude.assert_not_called()
+
+    def test_normal_sentences_still_reach_claude(self):
+        sentences = (
+            "I think their going to the store tomorrow.",
+            "So um I was like going to fix the the bug.",
+            "Can you refactor the parser and add tests for it?",
+            "Their going now.",
+            "yes",
+        )
+        with mock.patch.object(
+            text_improver, "_run_claude", return_value="Fixed."
+        ) as run_claude:
+            for text in sentences:
+                self.assertEqual(text_improver.improve_text(text), "Fixed.")
+        self.assertEqual(run_claude.call_count, len(sentences))
+
+    def test_caches_successful_replies_only(self):
+        with mock.patch.object(
+            text_improver, "_run_claude", side_effect=[None, "Run tests.", "unused"]
+        ) as run_claude:
+            self.assertEqual(text_improver.improve_text("run tests"), "run tests")
+            self.assertEqual(text_improver.improve_text("run tests"), "Run tests.")
+            self.assertEqual(text_improver.improve_text("run tests"), "Run tests.")
+        self.assertEqual(run_claude.call_count, 2)
+
+
+def _deleted(word):
+    return text_improver._DEL_PREFIX + word + text_improver._RESET
+
+
+def _inserted(word):
+    return text_improver._INS_PREFIX + word + text_improver._RESET
+
+
+class ColoredDiffTests(unittest.TestCase):
+    def setUp(self):
+        # Pin the difflib path; rapidfuzz may align edits differently
+        patcher = mock.patch.object(text_improver, "_Levenshtein", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_identical_text_is_unmarked(self):
+        self.assertEqual(
+            text_improver._colored_diff("run the tests", "run the tests"),
+            "run the tests",
+        )
+
+    def test_tail_punctuation_edit(self):
+        self.assertEqual(
+            text_improver._colored_diff("run the tests", "run the tests."),
+            "run the " + _deleted("tests") + " " + _inserted("tests."),
+        )
+
+    def test_insert_at_start(self):
+        self.assertEqual(
+            text_improver._colored_diff("world", "hello world"),
+            _inserted("hello") + " world",
+        )
+
+    def test_insert_at_end(self):
+        self.assertEqual(
+            text_improver._colored_diff("hello", "hello world"),
+            "hello " + _inserted("world"),
+        )
+
+    def test_empty_original(self):
+        self.assertEqual(
+            text_improver._colored_diff("", "Hi there."),
+            _inserted("Hi") + " " + _inserted("there."),
+        )
+
+    def test_empty_improved(self):
+        self.assertEqual(
+            text_improver._colored_diff("um ok", ""),
+            _deleted("um") + " " + _deleted("ok"),
+        )
+
+
+def _reconstruct(diff):
+    """Recover (original, improved) word lists from a colored diff."""
+    original, improved = [], []
+    for word in diff.split():
+        if word.startswith(text_improver._DEL_PREFIX):
+            original.append(word[len(text_improver._DEL_PREFIX):-len(text_improver._RESET)])
+        elif word.startswith(text_improver._INS_PREFIX):
+            improved.append(word[len(text_improver._INS_PREFIX):-len(text_improver._RESET)])
+        else:
+            original.append(word)
+            improved.append(word)
+    return original, improved
+
+
+class WordOpcodesTests(unittest.TestCase):
+    _PAIRS = (
+        ("so um i think the the bug is fixed", "So I think the bug is fixed."),
+        ("run tests", "Run the tests, then commit."),
+        ("alpha beta gamma", "delta"),
+    )
+
+    def test_levenshtein_opcodes_reconstruct_both_sides(self):
+        # A coarse but valid alignment, unlike anything SequenceMatcher emits
+        stub = mock.Mock()
+        stub.opcodes.side_effect = lambda a, b: [("replace", 0, len(a), 0, len(b))]
+        with mock.patch.object(text_improver, "_Levenshtein", stub):
+            for original, improved in self._PAIRS:
+                diff = text_improver._colored_diff(original, improved)
+                self.assertEqual(_reconstruct(diff), (original.split(), improved.split()))
+        self.assertTrue(stub.opcodes.called)
+
+    @unittest.skipIf(text_improver._Levenshtein is None, "rapidfuzz not installed")
+    def test_rapidfuzz_opcodes_reconstruct_both_sides(self):
+        for original, improved in self._PAIRS:
+            diff = text_improver._colored_diff(original, improved)
+            self.assertEqual(_reconstruct(diff), (original.split(), improved.split()))
+
+
+@unittest.skipIf(sys.platform == "win32", "fake claude CLI is a POSIX script")
+class ClaudeSpareTests(unittest.TestCase):
+    def setUp(self):
+        text_improver._improve_cached.cache_clear()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        script = Path(temp_dir.name) / "claude"
+        script.write_text(f"#!{sys.executable}\n{_FAKE_CLAUDE}")
+        script.chmod(0o755)
+
+        path = temp_dir.name + os.pathsep + os.environ.get("PATH", "")
+        env_patch = mock.patch.dict(os.environ, {"PATH": path})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+        self.spare = text_improver._ClaudeSpare()
+        self.addCleanup(self.spare.close)
+        spare_patch = mock.patch.object(text_improver, "_spare", self.spare)
+        spare_patch.start()
+        self.addCleanup(spare_patch.stop)
+
+    def test_each_prompt_goes_to_a_fresh_process(self):
+        self.spare.start()
+        self.assertEqual(self.spare.ask("Text: first", 10), "FIRST (1)")
+        self.assertEqual(self.spare.ask("Text: second", 10), "SECOND (1)")
+        # A replacement is already waiting for the next prompt
+        self.assertIsNone(self.spare._proc.poll())
+
+    def test_timeout_kills_process_and_recovers(self):
+        self.spare.start()
+        hung = self.spare._proc
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.spare.ask("Text: hang", 0.5)
+        self.assertIsNotNone(hung.poll())
+        self.assertEqual(self.spare.ask("Text: ok", 10), "OK (1)")
+
+    def test_close_does_not_wait_for_in_flight_prompt(self):
+        self.spare.start()
+        errors = []
+
+        def ask_hang():
+            try:
+                self.spare.ask("Text: hang", 2.0)
+            except subprocess.TimeoutExpired as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=ask_hang)
+        thread.start()
+        while self.spare._proc is not None:
+            time.sleep(0.01)
+
+        started = time.monotonic()
+        self.spare.close()
+        self.assertLess(time.monotonic() - started, 1.0)
+
+        thread.join(timeout=10)
+        self.assertEqual(len(errors), 1)
+        # No replacement is spawned once the spare has been closed
+        self.assertIsNone(self.spare._proc)
+
+    def test_crash_falls_back_once_without_disabling_spare(self):
+        self.assertEqual(text_improver.improve_text("crash now"), "ONESHOT crash now")
+        self.assertEqual(text_improver.improve_text("hello again"), "HELLO AGAIN (1)")
+
+    def test_error_result_does_not_rerun_one_shot(self):
+        with mock.patch.object(text_improver.subprocess, "run") as run:
+            self.assertEqual(text_improver.improve_text("error please"), "error please")
+        run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import string
+import types
+import unittest
+from unittest import mock
+
+from claude_stt import uinput_keyboard
+
+_KEY_NAMES = (
+    [f"KEY_{char}" for char in string.ascii_uppercase + string.digits]
+    + sorted(set(uinput_keyboard._SYMBOL_KEYS.values()))
+    + ["KEY_LEFTSHIFT"]
+)
+_CODES = {name: code for code, name in enumerate(_KEY_NAMES, start=1)}
+_FAKE_ECODES = types.SimpleNamespace(
+    ecodes=_CODES,
+    EV_KEY=1,
+    KEY_LEFTSHIFT=_CODES["KEY_LEFTSHIFT"],
+    KEY_ENTER=_CODES["KEY_ENTER"],
+)
+_FAKE_KEY = types.SimpleNamespace(shift="shift", enter="enter")
+_SHIFT = _CODES["KEY_LEFTSHIFT"]
+
+
+class _FakeUInput:
+    def __init__(self, name):
+        self.events = []
+        self.closed = False
+
+    def write(self, event_type, code, value):
+        self.events.append((event_type, code, value))
+
+    def syn(self):
+        self.events.append("syn")
+
+    def close(self):
+        self.closed = True
+
+
+class UInputKeyboardTests(unittest.TestCase):
+    def setUp(self):
+        for name, value in (
+            ("ecodes", _FAKE_ECODES),
+            ("UInput", _FakeUInput),
+            ("Key", _FAKE_KEY),
+            ("_DEVICE_SETTLE_SECONDS", 0),
+        ):
+            patcher = mock.patch.object(uinput_keyboard, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_char_table_maps_case_and_shifted_symbols(self):
+        table = uinput_keyboard._build_char_table()
+        self.assertEqual(table["a"], (_CODES["KEY_A"], False))
+        self.assertEqual(table["A"], (_CODES["KEY_A"], True))
+        self.assertEqual(table["7"], (_CODES["KEY_7"], False))
+        self.assertEqual(table["&"], (_CODES["KEY_7"], True))
+        self.assertEqual(table["?"], (_CODES["KEY_SLASH"], True))
+        self.assertEqual(table["\n"], (_CODES["KEY_ENTER"], False))
+        self.assertEqual(len(table), 95 + 2)  # printable ASCII plus newline and tab
+
+    def test_can_type_rejects_unmapped_characters(self):
+        kb = uinput_keyboard.UInputKeyboard()
+        self.assertTrue(kb.can_type("Hello, world!\n"))
+        self.assertFalse(kb.can_type("café"))
+        with self.assertRaises(ValueError):
+            kb.type("naïve")
+        self.assertEqual(kb._ui.events, [])
+
+    def test_type_wraps_shifted_characters_and_syncs_per_character(self):
+        kb = uinput_keyboard.UInputKeyboard()
+        kb.type("aB")
+        a, b = _CODES["KEY_A"], _CODES["KEY_B"]
+        self.assertEqual(
+            kb._ui.events,
+            [
+                (1, a, 1), (1, a, 0), "syn",
+                (1, _SHIFT, 1), (1, b, 1), (1, b, 0), (1, _SHIFT, 0), "syn",
+            ],
+        )
+
+    def test_pressed_releases_in_reverse_order(self):
+        kb = uinput_keyboard.UInputKeyboard()
+        with kb.pressed(_FAKE_KEY.shift):
+            kb.tap(_FAKE_KEY.enter)
+        enter = _CODES["KEY_ENTER"]
+        self.assertEqual(
+            kb._ui.events,
+            [
+                (1, _SHIFT, 1), "syn",
+                (1, enter, 1), "syn", (1, enter, 0), "syn",
+                (1, _SHIFT, 0), "syn",
+            ],
+        )
+
+    def test_create_requires_opt_in(self):
+        with mock.patch.dict(uinput_keyboard.os.environ, {}, clear=True):
+            self.assertIsNone(uinput_keyboard.create_uinput_keyboard())
+
+
+if __name__ == "__main__":
+    unittest.main()